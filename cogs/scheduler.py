@@ -2,12 +2,111 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from datetime import datetime
-from dateutil import parser as date_parser
 import logging
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from utils.permissions import is_admin
+from utils.datetime_utils import parse_user_datetime
 
 logger = logging.getLogger(__name__)
 
+# Repeating values accepted from the announcement modals
+_VALID_REPEATING = frozenset(('none', 'weekly'))
+# Role name that maps to the guild's default role
+_EVERYONE = '@everyone'
+
+# Confirmation sent after a practice announcement is scheduled
+_PRACTICE_CONFIRM_TPL = (
+    "✅ Practice announcement scheduled\n"
+    "**Practice Time:** {time}\n"
+    "**Location:** {loc}\n"
+    "**Announcement will be sent:** {when} ({repeat})\n"
+    "**Will ping:** {mention}"
+)
+
+# Display text for each repeating value in the delete menu
+_REPEATING_LABELS = {
+    'none': 'One-time',
+    'daily': 'Repeating daily',
+    'weekly': 'Repeating weekly',
+    'monthly': 'Repeating monthly',
+}
+
+
+@lru_cache(maxsize=128)
+def _format_announcement_time(announcement_time: datetime) -> Tuple[str, str]:
+    """Return the (short, long) display strings for an announcement time."""
+    return (announcement_time.strftime('%b %d, %I:%M %p'),
+            announcement_time.strftime('%B %d, %Y at %I:%M %p'))
+
+
+async def _prepare_submission(interaction: discord.Interaction, get_role_by_name, datetime_input: str,
+                              repeating: str, role_name: str):
+    """
+    Validate the shared announcement modal fields.
+
+    Sends an ephemeral error message to the user if any field is invalid.
+
+    Args:
+        interaction: Discord interaction object
+        get_role_by_name: Callable resolving (guild, name) to a role or None
+        datetime_input: Raw date/time entered by the user
+        repeating: Raw repeating value entered by the user
+        role_name: Raw role name entered by the user
+
+    Returns:
+        Tuple of (parsed_datetime, repeating_value, role), or None if validation failed
+    """
+    # Parse datetime
+    try:
+        parsed_datetime = parse_user_datetime(datetime_input)
+    except Exception:
+        await interaction.response.send_message(
+            "❌ Invalid date/time format. Please use formats like 'Feb 15 6pm' or '2026-02-15 18:00'.",
+            ephemeral=True
+        )
+        return None
+
+    # Store naive local times only; aware input is converted to local time
+    if parsed_datetime.tzinfo is not None:
+        parsed_datetime = parsed_datetime.astimezone().replace(tzinfo=None)
+
+    # Validate datetime is in the future
+    if parsed_datetime.timestamp() <= time.time():
+        await interaction.response.send_message(
+            "❌ The date and time must be in the future.",
+            ephemeral=True
+        )
+        return None
+
+    # Validate repeating value
+    repeating_value = repeating.lower().strip()
+    if repeating_value not in _VALID_REPEATING:
+        await interaction.response.send_message(
+            "❌ Invalid repeating value. Must be: none or weekly",
+            ephemeral=True
+        )
+        return None
+
+    # Find the role
+    role_input = role_name.strip()
+    if role_input.lower() == _EVERYONE:
+        role = interaction.guild.default_role
+    else:
+        # Remove @ if present
+        role_input = role_input.lstrip('@')
+        role = get_role_by_name(interaction.guild, role_input)
+
+    if not role:
+        await interaction.response.send_message(
+            f"❌ Role '{role_name}' not found. Please check the role name and try again.",
+            ephemeral=True
+        )
+        return None
+
+    return parsed_datetime, repeating_value, role
+
 
 class CustomAnnouncementModal(discord.ui.Modal, title='Schedule Custom Announcement'):
     """Modal for collecting custom announcement details."""
@@ -42,55 +141,24 @@ class CustomAnnouncementModal(discord.ui.Modal, title='Schedule Custom Announcem
         max_length=100
     )
 
-    def __init__(self, scheduler):
+    def __init__(self, scheduler, get_role_by_name):
         super().__init__()
         self.scheduler = scheduler
+        self.get_role_by_name = get_role_by_name
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle form submission."""
         try:
-            # Parse datetime
-            try:
-                parsed_datetime = date_parser.parse(self.datetime_input.value)
-            except Exception as e:
-                await interaction.response.send_message(
-                    f"❌ Invalid date/time format. Please use formats like 'Feb 15 6pm' or '2026-02-15 18:00'.",
-                    ephemeral=True
-                )
-                return
-
-            # Validate datetime is in the future
-            if parsed_datetime <= datetime.now():
-                await interaction.response.send_message(
-                    "❌ The date and time must be in the future.",
-                    ephemeral=True
-                )
-                return
-
-            # Validate repeating value
-            repeating_value = self.repeating.value.lower().strip()
-            if repeating_value not in ['none', 'weekly']:
-                await interaction.response.send_message(
-                    "❌ Invalid repeating value. Must be: none or weekly",
-                    ephemeral=True
-                )
-                return
-
-            # Find the role
-            role_input = self.role_name.value.strip()
-            if role_input.lower() == '@everyone':
-                role = interaction.guild.default_role
-            else:
-                # Remove @ if present
-                role_input = role_input.lstrip('@')
-                role = discord.utils.get(interaction.guild.roles, name=role_input)
-
-            if not role:
-                await interaction.response.send_message(
-                    f"❌ Role '{self.role_name.value}' not found. Please check the role name and try again.",
-                    ephemeral=True
-                )
+            prepared = await _prepare_submission(
+                interaction,
+                self.get_role_by_name,
+                self.datetime_input.value,
+                self.repeating.value,
+                self.role_name.value
+            )
+            if prepared is None:
                 return
+            parsed_datetime, repeating_value, role = prepared
 
             # Create the announcement
             announcement = await self.scheduler.create_announcement(
@@ -100,6 +168,8 @@ class CustomAnnouncementModal(discord.ui.Modal, title='Schedule Custom Announcem
                 datetime_str=parsed_datetime.isoformat(),
                 repeating=repeating_value,
                 role_id=role.id,
+                role_mention=role.mention,
+                parsed_time=parsed_datetime,
                 created_by=interaction.user.id
             )
 
@@ -112,7 +182,7 @@ class CustomAnnouncementModal(discord.ui.Modal, title='Schedule Custom Announcem
             )
 
         except Exception as e:
-            logger.error(f'Error creating custom announcement: {e}', exc_info=True)
+            logger.exception('Error creating custom announcement')
             await interaction.response.send_message(
                 f"❌ Error creating announcement: {str(e)}",
                 ephemeral=True
@@ -158,55 +228,24 @@ class PracticeAnnouncementModal(discord.ui.Modal, title='Schedule Practice Annou
         max_length=100
     )
 
-    def __init__(self, scheduler):
+    def __init__(self, scheduler, get_role_by_name):
         super().__init__()
         self.scheduler = scheduler
+        self.get_role_by_name = get_role_by_name
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle form submission."""
         try:
-            # Parse datetime
-            try:
-                parsed_datetime = date_parser.parse(self.datetime_input.value)
-            except Exception as e:
-                await interaction.response.send_message(
-                    f"❌ Invalid date/time format. Please use formats like 'Feb 15 6pm' or '2026-02-15 18:00'.",
-                    ephemeral=True
-                )
-                return
-
-            # Validate datetime is in the future
-            if parsed_datetime <= datetime.now():
-                await interaction.response.send_message(
-                    "❌ The date and time must be in the future.",
-                    ephemeral=True
-                )
-                return
-
-            # Validate repeating value
-            repeating_value = self.repeating.value.lower().strip()
-            if repeating_value not in ['none', 'weekly']:
-                await interaction.response.send_message(
-                    "❌ Invalid repeating value. Must be: none or weekly",
-                    ephemeral=True
-                )
-                return
-
-            # Find the role
-            role_input = self.role_name.value.strip()
-            if role_input.lower() == '@everyone':
-                role = interaction.guild.default_role
-            else:
-                # Remove @ if present
-                role_input = role_input.lstrip('@')
-                role = discord.utils.get(interaction.guild.roles, name=role_input)
-
-            if not role:
-                await interaction.response.send_message(
-                    f"❌ Role '{self.role_name.value}' not found. Please check the role name and try again.",
-                    ephemeral=True
-                )
+            prepared = await _prepare_submission(
+                interaction,
+                self.get_role_by_name,
+                self.datetime_input.value,
+                self.repeating.value,
+                self.role_name.value
+            )
+            if prepared is None:
                 return
+            parsed_datetime, repeating_value, role = prepared
 
             # Create the announcement
             announcement = await self.scheduler.create_announcement(
@@ -217,22 +256,26 @@ class PracticeAnnouncementModal(discord.ui.Modal, title='Schedule Practice Annou
                 datetime_str=parsed_datetime.isoformat(),
                 repeating=repeating_value,
                 role_id=role.id,
+                role_mention=role.mention,
+                parsed_time=parsed_datetime,
                 created_by=interaction.user.id
             )
 
             # Send confirmation
             repeat_text = "one-time" if repeating_value == 'none' else f"repeating {repeating_value}"
             await interaction.response.send_message(
-                f"✅ Practice announcement scheduled\n"
-                f"**Practice Time:** {self.practice_time.value}\n"
-                f"**Location:** {self.location.value}\n"
-                f"**Announcement will be sent:** {parsed_datetime.strftime('%B %d, %Y at %I:%M %p')} ({repeat_text})\n"
-                f"**Will ping:** {role.mention}",
+                _PRACTICE_CONFIRM_TPL.format_map({
+                    'time': self.practice_time.value,
+                    'loc': self.location.value,
+                    'when': parsed_datetime.strftime('%B %d, %Y at %I:%M %p'),
+                    'repeat': repeat_text,
+                    'mention': role.mention,
+                }),
                 ephemeral=True
             )
 
         except Exception as e:
-            logger.error(f'Error creating practice announcement: {e}', exc_info=True)
+            logger.exception('Error creating practice announcement')
             await interaction.response.send_message(
                 f"❌ Error creating announcement: {str(e)}",
                 ephemeral=True
@@ -245,6 +288,41 @@ class SchedulerCommands(commands.Cog):
     def __init__(self, bot, scheduler):
         self.bot = bot
         self.scheduler = scheduler
+        # Lowercased role name -> role, keyed by guild ID
+        self._role_cache: Dict[int, Dict[str, discord.Role]] = {}
+
+    def get_role_by_name(self, guild: discord.Guild, name: str) -> Optional[discord.Role]:
+        """
+        Look up a guild role by name (case-insensitive).
+
+        Args:
+            guild: The guild to search
+            name: Role name without a leading @
+
+        Returns:
+            The matching role, or None if not found
+        """
+        roles = self._role_cache.get(guild.id)
+        if roles is None:
+            # Iterate in reverse so the first role with a given name wins
+            roles = {role.name.lower(): role for role in reversed(guild.roles)}
+            self._role_cache[guild.id] = roles
+        return roles.get(name.lower())
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        """Invalidate the role cache when a role is created."""
+        self._role_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Invalidate the role cache when a role is updated."""
+        self._role_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Invalidate the role cache when a role is deleted."""
+        self._role_cache.pop(role.guild.id, None)
 
     schedule_group = app_commands.Group(name="schedule", description="Manage scheduled announcements")
 
@@ -258,7 +336,7 @@ class SchedulerCommands(commands.Cog):
             )
             return
 
-        modal = CustomAnnouncementModal(self.scheduler)
+        modal = CustomAnnouncementModal(self.scheduler, self.get_role_by_name)
         await interaction.response.send_modal(modal)
 
     @schedule_group.command(name="practice", description="Schedule a practice announcement")
@@ -271,7 +349,7 @@ class SchedulerCommands(commands.Cog):
             )
             return
 
-        modal = PracticeAnnouncementModal(self.scheduler)
+        modal = PracticeAnnouncementModal(self.scheduler, self.get_role_by_name)
         await interaction.response.send_modal(modal)
 
     @schedule_group.command(name="delete", description="Delete a scheduled announcement")
@@ -304,17 +382,18 @@ class SchedulerCommands(commands.Cog):
         # Build select menu options (max 25)
         options = []
         for idx, announcement in enumerate(announcements[:25], start=1):
-            announcement_time = datetime.fromisoformat(announcement['datetime'])
-            repeating_text = "One-time" if announcement['repeating'] == 'none' else f"Repeating {announcement['repeating']}"
+            announcement_time = self.scheduler.get_announcement_time(announcement['id'])
+            short_time, long_time = _format_announcement_time(announcement_time)
+            repeating = announcement['repeating']
+            repeating_text = _REPEATING_LABELS.get(repeating) or f"Repeating {repeating}"
 
             # Format the announcement preview
             if announcement['type'] == 'practice':
                 label = f"{idx}. Practice at {announcement['location']}"
-                description = f"{announcement_time.strftime('%b %d, %I:%M %p')} - {repeating_text}"
             else:
                 text_preview = announcement['text'][:50] + '...' if len(announcement['text']) > 50 else announcement['text']
                 label = f"{idx}. {text_preview}"
-                description = f"{announcement_time.strftime('%b %d, %I:%M %p')} - {repeating_text}"
+            description = f"{short_time} - {repeating_text}"
 
             options.append(discord.SelectOption(
                 label=label[:100],  # Discord limit
@@ -325,7 +404,7 @@ class SchedulerCommands(commands.Cog):
             # Add to embed
             embed.add_field(
                 name=f"{idx}. [{announcement['type'].title()}] {repeating_text}",
-                value=f"Time: {announcement_time.strftime('%B %d, %Y at %I:%M %p')}\n"
+                value=f"Time: {long_time}\n"
                       f"Text: {announcement.get('text', announcement.get('location', 'N/A'))[:100]}",
                 inline=False
             )
@@ -2,10 +2,16 @@ import discord
 from discord.ext import commands
 import asyncio
 import logging
+from aiohttp import web
 import config
-from keep_alive import keep_alive
 from utils.task_scheduler import TaskScheduler
 
+# Use uvloop's faster event loop when it is installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -28,6 +34,8 @@ intents.message_content = True  # For future message listening features
 
 # Initialize bot
 bot = commands.Bot(command_prefix='!', intents=intents)
+# Slash commands only need syncing once per process, not on every reconnect
+bot.synced = False
 
 
 @bot.event
@@ -42,10 +50,13 @@ async def on_ready():
         logger.info('Task scheduler initialized')
 
     # Sync slash commands with the guild
+    if bot.synced:
+        return
     try:
         guild = discord.Object(id=bot_config['guild_id'])
         bot.tree.copy_global_to(guild=guild)
         await bot.tree.sync(guild=guild)
+        bot.synced = True
         logger.info(f'Synced slash commands to guild {bot_config["guild_id"]}')
     except Exception as e:
         logger.error(f'Failed to sync commands: {e}')
@@ -74,14 +85,30 @@ async def load_extensions():
             logger.error(f'Failed to load extension {cog}: {e}')
 
 
+async def keep_alive_home(request):
+    """Simple health check endpoint for UptimePing."""
+    return web.Response(text="Bot is alive!")
+
+
+async def start_keep_alive():
+    """Start the keep-alive web server on port 8080 on the bot's event loop."""
+    app = web.Application()
+    app.router.add_get('/', keep_alive_home)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '0.0.0.0', 8080)
+    await site.start()
+    return runner
+
+
 async def main():
     """Main function to start the bot."""
-    # Start Flask keep-alive server for Repl.it
-    keep_alive()
+    # Start keep-alive server for Repl.it
+    keep_alive_runner = await start_keep_alive()
     logger.info('Keep-alive server started on port 8080')
 
     # Initialize scheduler before loading extensions
-    bot.scheduler = TaskScheduler(bot)
+    bot.scheduler = TaskScheduler(bot, bot_config['announcement_channel_id'])
     logger.info('Task scheduler created')
 
     # Load extensions
@@ -93,7 +120,14 @@ async def main():
     except KeyboardInterrupt:
         logger.info('Bot shutting down...')
         await bot.close()
+    finally:
+        # Write any pending announcement changes before exiting
+        await bot.scheduler.close()
+        await keep_alive_runner.cleanup()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
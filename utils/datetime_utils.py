@@ -0,0 +1,38 @@
+from datetime import datetime
+
+# Common formats tried with strptime before falling back to dateutil
+_FAST_FORMATS = [
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%dT%H:%M:%S',
+    '%b %d %I%p',
+    '%b %d %Y %I:%M %p',
+]
+
+
+def parse_user_datetime(value: str) -> datetime:
+    """
+    Parse a user-supplied date/time string.
+
+    Args:
+        value: Date/time string entered by the user
+
+    Returns:
+        The parsed datetime
+
+    Raises:
+        ValueError: If the string cannot be parsed
+    """
+    value = value.strip()
+    for fmt in _FAST_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        # Formats without a year default to 1900; match dateutil and use the current year
+        if '%Y' not in fmt:
+            parsed = parsed.replace(year=datetime.now().year)
+        return parsed
+
+    # Imported here so dateutil is only loaded when the fast path misses
+    from dateutil import parser as date_parser
+    return date_parser.parse(value)
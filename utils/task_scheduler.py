@@ -1,6 +1,8 @@
-import json
+import asyncio
+import itertools
 import os
-import uuid
+import shutil
+import time
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -8,55 +10,110 @@ import discord
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.cron import CronTrigger
-import aiofiles
+import orjson
 
 logger = logging.getLogger(__name__)
 
 ANNOUNCEMENTS_FILE = 'data/announcements.json'
 BACKUP_FILE = 'data/announcements.json.bak'
+# Number of successful writes between backups of the announcements file
+BACKUP_INTERVAL = 10
+# Seconds to wait after a change so bursts of changes produce one write
+WRITE_DEBOUNCE_SECONDS = 0.1
+# Longest wait between retries after a failed write
+WRITE_RETRY_MAX_SECONDS = 30
+
+# Trigger factory for each repeating type, given the announcement time
+_TRIGGERS = {
+    'none': lambda t: DateTrigger(run_date=t),
+    'daily': lambda t: CronTrigger(hour=t.hour, minute=t.minute),
+    'weekly': lambda t: CronTrigger(day_of_week=t.weekday(), hour=t.hour, minute=t.minute),
+    'monthly': lambda t: CronTrigger(day=t.day, hour=t.hour, minute=t.minute),
+}
+
+# Source of announcement IDs; seeded from the clock so IDs stay unique across restarts
+_id_counter = itertools.count(int(time.time()))
+
+
+def _read_sync(path: str) -> bytes:
+    """Read a file's contents in one blocking call."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _write_sync(path: str, data: bytes):
+    """Write data to a file in one blocking call."""
+    with open(path, 'wb') as f:
+        f.write(data)
 
 
 class TaskScheduler:
     """Manages scheduled announcements using APScheduler."""
 
-    def __init__(self, bot):
+    def __init__(self, bot, announcement_channel_id: int):
         self.bot = bot
+        self.channel_id = announcement_channel_id
+        self._channel = None
         self.scheduler = AsyncIOScheduler()
         self.announcements_file = ANNOUNCEMENTS_FILE
+        # In-memory copy of the announcements file keyed by ID; written through on every change
+        self._announcements: Dict[str, Dict] = {}
+        # Parsed announcement datetimes keyed by ID, kept in step with _announcements
+        self._parsed_dt: Dict[str, datetime] = {}
+        self._write_lock = asyncio.Lock()
+        # Set when the in-memory store has changes not yet written to disk
+        self._dirty = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writes_since_backup = 0
+        self._has_backup = False
 
     async def initialize(self):
         """Initialize the scheduler and load existing announcements."""
         self.scheduler.start()
         logger.info('APScheduler started')
 
-        # Load and reschedule all pending announcements
+        # Load announcements once; the in-memory copy is authoritative afterwards
+        self._announcements = {a['id']: a for a in await self._load_announcements()}
+        self._parsed_dt = {a_id: datetime.fromisoformat(a['datetime'])
+                           for a_id, a in self._announcements.items()}
+
+        # Make sure a backup exists even if this process never reaches BACKUP_INTERVAL writes
+        self._has_backup = os.path.exists(BACKUP_FILE)
+        if not self._has_backup and os.path.exists(self.announcements_file):
+            await self._backup_announcements()
+
+        # Start the background writer that persists changes
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+        # Reschedule all pending announcements
         await self.load_and_reschedule_announcements()
 
     async def load_and_reschedule_announcements(self):
-        """Load announcements from JSON and reschedule all pending jobs."""
-        announcements = await self._load_announcements()
+        """Reschedule jobs for all pending announcements."""
         now = datetime.now()
         rescheduled = 0
         skipped = 0
 
-        for announcement in announcements:
-            announcement_time = datetime.fromisoformat(announcement['datetime'])
+        for announcement in self._announcements.values():
+            announcement_time = self._parsed_dt[announcement['id']]
 
             # Skip one-time announcements that are in the past
             if announcement['repeating'] == 'none' and announcement_time < now:
                 skipped += 1
-                logger.info(f"Skipping missed announcement: {announcement['id']}")
+                logger.info('Skipping missed announcement: %s', announcement['id'])
                 continue
 
             # Schedule the announcement
-            await self._schedule_job(announcement)
+            await self._schedule_job(announcement, parsed_time=announcement_time)
             rescheduled += 1
 
-        logger.info(f'Rescheduled {rescheduled} announcements, skipped {skipped} missed announcements')
+        logger.info('Rescheduled %d announcements, skipped %d missed announcements', rescheduled, skipped)
 
     async def create_announcement(self, announcement_type: str, text: str, location: Optional[str],
                                   datetime_str: str, repeating: str, role_id: int, created_by: int,
-                                  practice_time: Optional[str] = None) -> Dict:
+                                  practice_time: Optional[str] = None,
+                                  role_mention: Optional[str] = None,
+                                  parsed_time: Optional[datetime] = None) -> Dict:
         """
         Create a new announcement and schedule it.
 
@@ -69,12 +126,18 @@ class TaskScheduler:
             role_id: Discord role ID to ping
             created_by: User ID who created the announcement
             practice_time: Time of practice (for practice type only)
+            role_mention: Mention string for the role; derived from role_id if omitted
+            parsed_time: datetime_str already parsed, to avoid parsing it again
 
         Returns:
             The created announcement dictionary
         """
+        announcement_id = f'a{next(_id_counter):x}'
+        while announcement_id in self._announcements:
+            announcement_id = f'a{next(_id_counter):x}'
+
         announcement = {
-            'id': str(uuid.uuid4()),
+            'id': announcement_id,
             'type': announcement_type,
             'text': text,
             'location': location,
@@ -82,17 +145,21 @@ class TaskScheduler:
             'datetime': datetime_str,
             'repeating': repeating,
             'role_id': role_id,
+            'role_mention': role_mention if role_mention is not None else f'<@&{role_id}>',
             'created_by': created_by,
             'created_at': datetime.now().isoformat()
         }
 
+        if parsed_time is None:
+            parsed_time = datetime.fromisoformat(datetime_str)
+
         # Save to JSON
-        await self._save_announcement(announcement)
+        self._save_announcement(announcement, parsed_time)
 
         # Schedule the job
-        await self._schedule_job(announcement)
+        await self._schedule_job(announcement, parsed_time=parsed_time)
 
-        logger.info(f'Created announcement {announcement["id"]} for {datetime_str}')
+        logger.info('Created announcement %s for %s', announcement['id'], datetime_str)
         return announcement
 
     async def delete_announcement(self, announcement_id: str) -> bool:
@@ -100,41 +167,40 @@ class TaskScheduler:
         Delete an announcement by ID.
 
         Args:
-            announcement_id: The UUID of the announcement to delete
+            announcement_id: The ID of the announcement to delete
 
         Returns:
             True if deleted successfully, False if not found
         """
-        announcements = await self._load_announcements()
-        original_count = len(announcements)
-
-        # Filter out the announcement to delete
-        announcements = [a for a in announcements if a['id'] != announcement_id]
-
-        if len(announcements) == original_count:
+        if self._announcements.pop(announcement_id, None) is None:
             return False  # Announcement not found
+        self._parsed_dt.pop(announcement_id, None)
 
         # Save updated list
-        await self._write_announcements(announcements)
+        self._dirty.set()
 
         # Cancel the scheduled job
         try:
             self.scheduler.remove_job(announcement_id)
-            logger.info(f'Cancelled job {announcement_id}')
+            logger.info('Cancelled job %s', announcement_id)
         except Exception as e:
-            logger.warning(f'Could not cancel job {announcement_id}: {e}')
+            logger.warning('Could not cancel job %s: %s', announcement_id, e)
 
-        logger.info(f'Deleted announcement {announcement_id}')
+        logger.info('Deleted announcement %s', announcement_id)
         return True
 
     async def get_all_announcements(self) -> List[Dict]:
-        """Get all pending announcements."""
-        return await self._load_announcements()
+        """Get all pending announcements, sorted by datetime."""
+        return sorted(self._announcements.values(), key=lambda a: self._parsed_dt[a['id']])
+
+    def get_announcement_time(self, announcement_id: str) -> Optional[datetime]:
+        """Get the parsed datetime of an announcement, or None if not found."""
+        return self._parsed_dt.get(announcement_id)
 
-    async def _schedule_job(self, announcement: Dict):
-        """Schedule a job with APScheduler."""
+    async def _schedule_job(self, announcement: Dict, parsed_time: Optional[datetime] = None):
+        """Schedule a job with APScheduler, reusing parsed_time if the datetime is already parsed."""
         announcement_id = announcement['id']
-        announcement_time = datetime.fromisoformat(announcement['datetime'])
+        announcement_time = parsed_time if parsed_time is not None else datetime.fromisoformat(announcement['datetime'])
         repeating = announcement['repeating']
 
         # Remove existing job if it exists
@@ -144,21 +210,11 @@ class TaskScheduler:
             pass
 
         # Create trigger based on repeating type
-        if repeating == 'none':
-            trigger = DateTrigger(run_date=announcement_time)
-        elif repeating == 'daily':
-            trigger = CronTrigger(hour=announcement_time.hour, minute=announcement_time.minute)
-        elif repeating == 'weekly':
-            trigger = CronTrigger(day_of_week=announcement_time.weekday(),
-                                  hour=announcement_time.hour,
-                                  minute=announcement_time.minute)
-        elif repeating == 'monthly':
-            trigger = CronTrigger(day=announcement_time.day,
-                                  hour=announcement_time.hour,
-                                  minute=announcement_time.minute)
-        else:
-            logger.error(f'Unknown repeating type: {repeating}')
+        trigger_factory = _TRIGGERS.get(repeating)
+        if trigger_factory is None:
+            logger.error('Unknown repeating type: %s', repeating)
             return
+        trigger = trigger_factory(announcement_time)
 
         # Schedule the job
         self.scheduler.add_job(
@@ -169,31 +225,32 @@ class TaskScheduler:
             replace_existing=True
         )
 
-        logger.info(f'Scheduled job {announcement_id} with trigger {repeating}')
+        logger.info('Scheduled job %s with trigger %s', announcement_id, repeating)
 
     async def _execute_announcement(self, announcement_id: str):
         """Execute an announcement by sending it to the Discord channel."""
         try:
-            # Load announcement data
-            announcements = await self._load_announcements()
-            announcement = next((a for a in announcements if a['id'] == announcement_id), None)
+            # Look up announcement data
+            announcement = self._announcements.get(announcement_id)
 
             if not announcement:
-                logger.error(f'Announcement {announcement_id} not found')
+                logger.error('Announcement %s not found', announcement_id)
                 return
 
-            # Get the announcement channel
-            channel_id = int(os.getenv('ANNOUNCEMENT_CHANNEL_ID'))
-            channel = self.bot.get_channel(channel_id)
-
-            if not channel:
-                logger.error(f'Channel {channel_id} not found')
-                return
-
-            # Get the role to ping
-            guild = channel.guild
-            role = guild.get_role(announcement['role_id'])
-            role_mention = role.mention if role else ''
+            # Get the announcement channel, resolving it once
+            channel = self._channel
+            if channel is None:
+                channel = self.bot.get_channel(self.channel_id)
+                if not channel:
+                    logger.error('Channel %s not found', self.channel_id)
+                    return
+                self._channel = channel
+
+            # Get the role to ping, looking it up only for announcements saved without a mention
+            role_mention = announcement.get('role_mention')
+            if role_mention is None:
+                role = channel.guild.get_role(announcement['role_id'])
+                role_mention = role.mention if role else ''
 
             # Format the message based on type
             if announcement['type'] == 'practice':
@@ -204,21 +261,64 @@ class TaskScheduler:
 
             # Send the announcement
             await channel.send(message)
-            logger.info(f'Sent announcement {announcement_id}')
+            logger.info('Sent announcement %s', announcement_id)
 
             # If it's a one-time announcement, remove it from storage
             if announcement['repeating'] == 'none':
                 await self.delete_announcement(announcement_id)
-                logger.info(f'Removed one-time announcement {announcement_id}')
+                logger.info('Removed one-time announcement %s', announcement_id)
 
-        except Exception as e:
-            logger.error(f'Error executing announcement {announcement_id}: {e}', exc_info=True)
+        except Exception:
+            logger.exception('Error executing announcement %s', announcement_id)
+
+    async def close(self):
+        """Stop the background writer and write any pending changes to disk."""
+        if self._writer_task is not None:
+            # Any write in progress is shielded; the flush below waits for it on the lock
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        await self._flush()
+
+    def _save_announcement(self, announcement: Dict, announcement_time: datetime):
+        """Add a new announcement and queue a write to the JSON file."""
+        self._announcements[announcement['id']] = announcement
+        self._parsed_dt[announcement['id']] = announcement_time
+        self._dirty.set()
+
+    async def _writer_loop(self):
+        """Write the in-memory store to disk after each burst of changes, retrying failed writes."""
+        delay = WRITE_DEBOUNCE_SECONDS
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(delay)
+            # Shielded so close() cannot cancel a write halfway through
+            if await asyncio.shield(self._flush()):
+                delay = WRITE_DEBOUNCE_SECONDS
+            else:
+                delay = min(delay * 2, WRITE_RETRY_MAX_SECONDS)
+
+    async def _flush(self) -> bool:
+        """
+        Write the in-memory store to disk if it has pending changes.
 
-    async def _save_announcement(self, announcement: Dict):
-        """Save a new announcement to the JSON file."""
-        announcements = await self._load_announcements()
-        announcements.append(announcement)
-        await self._write_announcements(announcements)
+        Returns:
+            False if the write failed and is still pending, True otherwise
+        """
+        async with self._write_lock:
+            if not self._dirty.is_set():
+                return True
+            self._dirty.clear()
+            try:
+                await self._write_announcements(list(self._announcements.values()))
+            except Exception:
+                # Already logged; mark dirty again so the writer retries
+                self._dirty.set()
+                return False
+            return True
 
     async def _load_announcements(self) -> List[Dict]:
         """Load announcements from JSON file."""
@@ -226,36 +326,41 @@ class TaskScheduler:
             if not os.path.exists(self.announcements_file):
                 return []
 
-            async with aiofiles.open(self.announcements_file, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
-                return data.get('announcements', [])
+            content = await asyncio.to_thread(_read_sync, self.announcements_file)
+            data = orjson.loads(content)
+            return data.get('announcements', [])
         except Exception as e:
-            logger.error(f'Error loading announcements: {e}')
+            logger.error('Error loading announcements: %s', e)
             return []
 
     async def _write_announcements(self, announcements: List[Dict]):
-        """Write announcements to JSON file with atomic write and backup."""
+        """Write announcements to JSON file with atomic write and periodic backup."""
         try:
-            # Create backup if file exists
-            if os.path.exists(self.announcements_file):
-                if os.path.exists(BACKUP_FILE):
-                    os.remove(BACKUP_FILE)
-                os.rename(self.announcements_file, BACKUP_FILE)
-
-            # Write to file atomically
+            # Write to a temp file, then atomically replace the real file
             data = {'announcements': announcements}
             temp_file = f'{self.announcements_file}.tmp'
 
-            async with aiofiles.open(temp_file, 'w') as f:
-                await f.write(json.dumps(data, indent=2))
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(_write_sync, temp_file, serialized)
 
-            os.rename(temp_file, self.announcements_file)
+            os.replace(temp_file, self.announcements_file)
             logger.debug('Saved announcements to file')
 
         except Exception as e:
-            logger.error(f'Error writing announcements: {e}')
-            # Restore from backup if write failed
-            if os.path.exists(BACKUP_FILE):
-                os.rename(BACKUP_FILE, self.announcements_file)
+            logger.error('Error writing announcements: %s', e)
             raise
+
+        # Back up the file on the first write without a backup, then every BACKUP_INTERVAL writes
+        self._writes_since_backup += 1
+        if not self._has_backup or self._writes_since_backup >= BACKUP_INTERVAL:
+            await self._backup_announcements()
+
+    async def _backup_announcements(self):
+        """Copy the announcements file to BACKUP_FILE off the event loop."""
+        try:
+            await asyncio.to_thread(shutil.copy2, self.announcements_file, BACKUP_FILE)
+            self._writes_since_backup = 0
+            self._has_backup = True
+            logger.debug('Backed up announcements file')
+        except Exception as e:
+            logger.warning('Error backing up announcements: %s', e)